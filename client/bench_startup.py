@@ -0,0 +1,51 @@
+# client/bench_startup.py
+# İstemcinin açılış süresini ölçer: temiz bir süreçte import + Tk + App + login penceresinin
+# ilk çizimi. Her tekrar ayrı bir python süreci (modül cache'i ısınmasın diye).
+#
+#   python -m client.bench_startup --runs 10
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import tkinter as tk
+from client.main import App
+t_import = time.perf_counter()
+root = tk.Tk()
+app = App(root)
+root.update()
+t_shown = time.perf_counter()
+app.client.close()
+root.destroy()
+heavy = [m for m in ("PIL.ImageTk", "requests", "client.ui.game_screen") if m in sys.modules]
+print(json.dumps({"import": t_import - t0, "shown": t_shown - t0, "heavy": heavy}))
+"""
+
+
+def run_once():
+    out = subprocess.run([sys.executable, "-c", CHILD], capture_output=True, text=True, check=True)
+    # App may print connection errors before the result line
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure client startup time")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = [run_once() for _ in range(args.runs)]
+    imports = [r["import"] * 1000 for r in results]
+    shown = [r["shown"] * 1000 for r in results]
+    print(f"[BENCH] {args.runs} runs")
+    print(f"  imports done : median {statistics.median(imports):.1f} ms, min {min(imports):.1f} ms")
+    print(f"  login shown  : median {statistics.median(shown):.1f} ms, min {min(shown):.1f} ms")
+    print(f"  heavy modules loaded at startup: {results[-1]['heavy'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 # client/main.py
+import importlib
 import tkinter as tk
-from client.ui.login_screen import LoginScreen
-from client.ui.lobby_screen import LobbyScreen
-from client.ui.waiting_room import WaitingRoom
-from client.ui.game_screen import GameScreen
 from client.network.client_socket import ClientSocket
-from client.db.user_database import UserDatabase
-from client.utils.constants import WINDOW_SIZE, DB_PATH, SERVER_IP, SERVER_PORT
+from client.utils.constants import WINDOW_SIZE, SERVER_IP, SERVER_PORT
+
+# screens are imported on first navigation (game screen pulls in PIL + requests)
+SCREENS = {
+    "login": ("client.ui.login_screen", "LoginScreen"),
+    "lobby": ("client.ui.lobby_screen", "LobbyScreen"),
+    "waiting": ("client.ui.waiting_room", "WaitingRoom"),
+    "game": ("client.ui.game_screen", "GameScreen"),
+}
+
+def load_screen(name):
+    module, cls = SCREENS[name]
+    return getattr(importlib.import_module(module), cls)
 
 class App:
     def __init__(self, root):
@@ -19,8 +27,9 @@ class App:
         self.client.on("room_update", self._on_room_update)
         self.client.on("create_room_ok", lambda p: None)
         self.client.on("join_room_ok", lambda p: None)
-        # hold references
+        # hold references; screens are built once and reused
         self.frames = {}
+        self.current = None
         self.username = None
         self.current_room = None
 
@@ -28,33 +37,46 @@ class App:
         self.show_login()
 
     def clear_frame(self):
-        for child in self.root.winfo_children():
-            child.destroy()
+        # hide the active screen instead of destroying it
+        if self.current:
+            self.current.frame.pack_forget()
+            self.current = None
+
+    def _screen(self, name, *args):
+        screen = self.frames.get(name)
+        if screen is None:
+            screen = load_screen(name)(self.root, *args, navigate=self._navigate)
+            self.frames[name] = screen
+        return screen
 
     def show_login(self):
         self.clear_frame()
-        login = LoginScreen(self.root, navigate=self._navigate)
-        self.frames["login"] = login
+        login = self._screen("login")
+        login.show()
+        self.current = login
 
     def show_lobby(self, username):
         self.clear_frame()
         self.username = username
-        lobby = LobbyScreen(self.root, username, self.client, navigate=self._navigate)
-        self.frames["lobby"] = lobby
+        lobby = self._screen("lobby", username, self.client)
+        lobby.show(username)
+        self.current = lobby
 
     def show_waiting(self, username, room_id=None):
         self.clear_frame()
         self.username = username
         self.current_room = room_id
-        waiting = WaitingRoom(self.root, username, self.client, navigate=self._navigate)
-        self.frames["waiting"] = waiting
+        waiting = self._screen("waiting", username, self.client)
+        waiting.show(username)
+        self.current = waiting
 
     def show_game(self, username, room_id):
         self.clear_frame()
         self.username = username
         self.current_room = room_id
-        game = GameScreen(self.root, username, self.client, room_id, navigate=self._navigate)
-        self.frames["game"] = game
+        game = self._screen("game", username, self.client, room_id)
+        game.show(username, room_id)
+        self.current = game
 
     def _navigate(self, where, **kwargs):
         # central navigation method used by screens
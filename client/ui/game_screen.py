@@ -1,8 +1,6 @@
 # client/ui/game_screen.py
 import tkinter as tk
 from tkinter import messagebox, ttk
-from PIL import Image, ImageTk
-import requests
 from io import BytesIO
 import threading
 from client.utils.constants import API_KEY
@@ -16,7 +14,6 @@ class GameScreen:
         self.navigate = navigate
 
         self.frame = tk.Frame(self.root)
-        self.frame.pack(fill="both", expand=True)
 
         # UI
         self.header = tk.Label(self.frame, text=f"Room: {room_id} | Player: {username}", font=("Arial", 14))
@@ -52,6 +49,25 @@ class GameScreen:
         self.current_coords = None
         self.photo = None
         self.map_photo = None
+        # bumped per round / per show(); image loaders from an older id are discarded
+        self.load_id = 0
+
+    def show(self, username, room_id):
+        # screen is reused across games: reset per-game state
+        self.username = username
+        self.room_id = room_id
+        self.header.config(text=f"Room: {room_id} | Player: {username}")
+        self.info_label.config(text="Waiting for round...")
+        self.canvas.delete("all")
+        self.map_thumb_label.configure(image="")
+        self.map_thumb_label.unbind("<Enter>")
+        self.lat_ent.delete(0, tk.END)
+        self.lon_ent.delete(0, tk.END)
+        self.current_coords = None
+        self.photo = None
+        self.map_photo = None
+        self.load_id += 1
+        self.frame.pack(fill="both", expand=True)
 
     # ----------------- Socket event handlers -----------------
     def on_new_round(self, payload):
@@ -64,8 +80,9 @@ class GameScreen:
         lat = coords.get("lat")
         lon = coords.get("lon")
         # fetch street view image in background
-        threading.Thread(target=self.load_street_view, args=(lat, lon), daemon=True).start()
-        threading.Thread(target=self.load_map_thumb, args=(lat, lon), daemon=True).start()
+        self.load_id += 1
+        threading.Thread(target=self.load_street_view, args=(lat, lon, self.load_id), daemon=True).start()
+        threading.Thread(target=self.load_map_thumb, args=(lat, lon, self.load_id), daemon=True).start()
 
     def on_player_guessed(self, payload):
         username = payload.get("username")
@@ -91,24 +108,39 @@ class GameScreen:
         self.navigate("lobby", username=self.username)
 
     # ----------------- Image loaders -----------------
-    def load_street_view(self, lat, lon):
+    def load_street_view(self, lat, lon, load_id):
         try:
+            # heavy deps, imported on first use (background thread)
+            import requests
+            from PIL import Image, ImageTk
             url = f"https://maps.googleapis.com/maps/api/streetview?size=800x450&location={lat},{lon}&fov=90&heading=0&pitch=0&key={API_KEY}"
             resp = requests.get(url, timeout=15)
+            if load_id != self.load_id:
+                return
             img = Image.open(BytesIO(resp.content))
-            self.photo = ImageTk.PhotoImage(img)
+            photo = ImageTk.PhotoImage(img)
             # draw on canvas in main thread
-            self.canvas.after(0, lambda: self.canvas.create_image(0,0, anchor='nw', image=self.photo))
+            self.canvas.after(0, lambda: self._draw_street_view(load_id, photo))
         except Exception as e:
             print("StreetView load error:", e)
 
-    def load_map_thumb(self, lat, lon):
+    def _draw_street_view(self, load_id, photo):
+        # a newer round or game may have started while the image was loading
+        if load_id != self.load_id:
+            return
+        self.photo = photo
+        self.canvas.create_image(0, 0, anchor='nw', image=photo)
+
+    def load_map_thumb(self, lat, lon, load_id):
         try:
+            import requests
+            from PIL import Image, ImageTk
             url = f"https://maps.googleapis.com/maps/api/staticmap?center={lat},{lon}&zoom=14&size=200x120&key={API_KEY}"
             resp = requests.get(url, timeout=10)
+            if load_id != self.load_id:
+                return
             img = Image.open(BytesIO(resp.content))
-            self.map_photo = ImageTk.PhotoImage(img)
-            self.map_thumb_label.after(0, lambda: self.map_thumb_label.configure(image=self.map_photo))
+            map_photo = ImageTk.PhotoImage(img)
             # bind hover to enlarge
             def on_enter(e):
                 top = tk.Toplevel(self.root)
@@ -124,10 +156,17 @@ class GameScreen:
                     lbl.pack()
                 except Exception as ex:
                     tk.Label(top, text="Map load error").pack()
-            self.map_thumb_label.bind("<Enter>", on_enter)
+            self.map_thumb_label.after(0, lambda: self._show_map_thumb(load_id, map_photo, on_enter))
         except Exception as e:
             print("Map thumb load error:", e)
 
+    def _show_map_thumb(self, load_id, map_photo, on_enter):
+        if load_id != self.load_id:
+            return
+        self.map_photo = map_photo
+        self.map_thumb_label.configure(image=map_photo)
+        self.map_thumb_label.bind("<Enter>", on_enter)
+
     # ----------------- Guessing -----------------
     def submit_guess(self):
         try:
@@ -13,13 +13,17 @@ class LobbyScreen:
         self.build_ui()
 
     def build_ui(self):
-        self.frame.pack(fill="both", expand=True)
-
-        tk.Label(self.frame, text=f"Welcome, {self.username}", font=("Arial", 20)).pack(pady=10)
+        self.welcome = tk.Label(self.frame, text=f"Welcome, {self.username}", font=("Arial", 20))
+        self.welcome.pack(pady=10)
         tk.Button(self.frame, text="Create Room", command=self.create_room).pack(pady=5)
         tk.Button(self.frame, text="Join Room", command=self.join_room).pack(pady=5)
         tk.Button(self.frame, text="Logout", command=lambda: self.navigate("login")).pack(pady=10)
 
+    def show(self, username):
+        self.username = username
+        self.welcome.config(text=f"Welcome, {username}")
+        self.frame.pack(fill="both", expand=True)
+
     def create_room(self):
         self.client.send("create_room", {"username": self.username})
         self.navigate("waiting", username=self.username)
@@ -14,8 +14,6 @@ class LoginScreen:
         self.build_ui()
 
     def build_ui(self):
-        self.frame.pack(fill="both", expand=True)
-
         tk.Label(self.frame, text="GeoGuessr Login", font=("Arial", 24)).pack(pady=20)
 
         tk.Label(self.frame, text="Username:").pack()
@@ -29,6 +27,11 @@ class LoginScreen:
         tk.Button(self.frame, text="Sign In", command=self.sign_in).pack(pady=10)
         tk.Button(self.frame, text="Sign Up", command=self.sign_up).pack(pady=10)
 
+    def show(self):
+        # reused between logouts: don't keep the previous password around
+        self.password_entry.delete(0, tk.END)
+        self.frame.pack(fill="both", expand=True)
+
     def sign_in(self):
         u = self.username_entry.get().strip()
         p = self.password_entry.get().strip()
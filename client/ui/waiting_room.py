@@ -13,7 +13,6 @@ class WaitingRoom:
         self.build_ui()
 
     def build_ui(self):
-        self.frame.pack(fill="both", expand=True)
         tk.Label(self.frame, text="Waiting Room", font=("Arial", 22)).pack(pady=10)
         self.player_list = tk.Listbox(self.frame)
         self.player_list.pack(pady=10)
@@ -21,6 +20,11 @@ class WaitingRoom:
         tk.Button(self.frame, text="Start Game", command=self.start_game).pack(pady=10)
         tk.Button(self.frame, text="Back to Lobby", command=lambda: self.navigate("lobby", username=self.username)).pack(pady=5)
 
+    def show(self, username):
+        self.username = username
+        self.update_players([])
+        self.frame.pack(fill="both", expand=True)
+
     def update_players(self, players):
         self.player_list.delete(0, tk.END)
         for p in players:
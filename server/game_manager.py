@@ -4,6 +4,9 @@ import random
 import time
 import threading
 import math
+from models import Room, Guess, PLAYING, FINISHED, START_SCORE
+from replay_log import ReplayWriter
+from spectators import SpectatorHub
 
 # Basit koordinat listesi — gerektiğinde genişlet
 SAMPLE_LOCATIONS = [
@@ -26,22 +29,31 @@ def haversine(lat1, lon1, lat2, lon2):
     return R * c
 
 class GameManager:
-    def __init__(self):
-        # rooms: room_id -> {
-        #   "players": {conn: {"username": str, "score": int, "guessed": bool}},
-        #   "state": "waiting"/"playing"/"finished",
-        #   "current_round": int,
-        #   "coords": {...},
-        #   "guesses": {conn: {"lat":..., "lon":..., "time":...}}
-        # }
+    def __init__(self, replay_dir=None, seed=None):
+        # rooms: room_id -> Room (bkz. models.py)
+        #   players: {pid: Player}, conn_ids: {conn: pid}, guesses: {pid: Guess}
         self.rooms = {}
-        self.lock = threading.Lock()
+        # broadcast kilit tutulurken de çağrılıyor -> reentrant olmalı
+        self.lock = threading.RLock()
+        # replay_dir verilirse her oda için binary olay kaydı tutulur (bkz. replay.py)
+        self.replay = ReplayWriter(replay_dir) if replay_dir else None
+        # per-room seeds are drawn from here; a fixed seed makes whole games reproducible
+        self.seeds = random.Random(seed)
+        # izleyiciler room.players'a girmez, ayrı fan-out thread'inden beslenir
+        self.spectators = SpectatorHub()
+
+    def _new_room(self, room_id):
+        seed = self.seeds.getrandbits(64)
+        log = self.replay.open_room(room_id, seed) if self.replay else None
+        return Room(room_id, rng=random.Random(seed), log=log)
 
     # Utility: safe send JSON
     def send(self, conn, obj):
+        self.send_raw(conn, json.dumps(obj).encode('utf-8'))
+
+    def send_raw(self, conn, data):
         try:
-            msg = json.dumps(obj).encode('utf-8')
-            conn.send(msg)
+            conn.send(data)
         except Exception:
             # ignore send errors; higher layer handles disconnects
             pass
@@ -50,87 +62,113 @@ class GameManager:
         with self.lock:
             room = self.rooms.get(room_id)
             if not room: return
-            for conn in list(room["players"].keys()):
-                self.send(conn, obj)
+            # encode once, send same bytes to everyone
+            data = json.dumps(obj).encode('utf-8')
+            for conn in room.conns():
+                self.send_raw(conn, data)
+            # under the lock, so spectate() can't snapshot between send and publish
+            self.spectators.publish(room_id, obj)
 
     def create_room(self, room_id, username, conn):
         with self.lock:
             if room_id in self.rooms:
                 self.send(conn, {"action": "create_room_failed", "payload": {"reason": "Room exists"}})
-                return
-            self.rooms[room_id] = {
-                "players": {conn: {"username": username, "score": 5000, "guessed": False}},
-                "state": "waiting",
-                "current_round": 0,
-                "coords": None,
-                "guesses": {}
-            }
+                return False
+            room = self._new_room(room_id)
+            player = room.add_player(conn, username)
+            if room.log: room.log.join(player.pid, username)
+            self.rooms[room_id] = room
             self.send(conn, {"action": "create_room_ok", "payload": {"room_id": room_id}})
             self.broadcast_room_update(room_id)
+            return True
 
     def join_room(self, room_id, username, conn):
         with self.lock:
             room = self.rooms.get(room_id)
             if not room:
                 self.send(conn, {"action": "join_room_failed", "payload": {"reason": "No such room"}})
-                return
-            room["players"][conn] = {"username": username, "score": 5000, "guessed": False}
+                return False
+            player = room.add_player(conn, username)
+            if room.log: room.log.join(player.pid, username)
             self.send(conn, {"action": "join_room_ok", "payload": {"room_id": room_id}})
             self.broadcast_room_update(room_id)
+            return True
 
     def leave_room(self, room_id, conn):
         with self.lock:
             room = self.rooms.get(room_id)
             if not room: return
-            if conn in room["players"]:
-                del room["players"][conn]
+            player = room.remove_player(conn)
+            if player and room.log: room.log.leave(player.pid)
             # if no players left, remove room
-            if not room["players"]:
+            if not room.players:
                 del self.rooms[room_id]
+                if room.log: room.log.close()
+                self.spectators.close_room(room_id)
                 return
             self.broadcast_room_update(room_id)
 
+    def spectate(self, room_id, conn):
+        with self.lock:
+            room = self.rooms.get(room_id)
+            if not room:
+                self.send(conn, {"action": "spectate_failed", "payload": {"reason": "No such room"}})
+                return False
+            # anlık görüntü doğrudan, sonrası SpectatorHub üzerinden gelir
+            self.send(conn, {"action": "spectate_ok", "payload": {
+                "room_id": room_id,
+                "state": room.state,
+                "round": room.current_round,
+                "coords": room.coords,
+                "players": room.player_list()
+            }})
+            self.spectators.add(room_id, conn)
+            return True
+
+    def stop_spectating(self, room_id, conn):
+        self.spectators.remove(room_id, conn)
+
     def broadcast_room_update(self, room_id):
         room = self.rooms.get(room_id)
         if not room: return
-        players = [{"username": p["username"], "score": p["score"]} for p in room["players"].values()]
-        self.broadcast(room_id, {"action": "room_update", "payload": {"players": players}})
+        self.broadcast(room_id, {"action": "room_update", "payload": {"players": room.player_list()}})
 
     def start_game(self, room_id):
         with self.lock:
             room = self.rooms.get(room_id)
             if not room: return
-            if len(room["players"]) < 2:
+            if room.state == PLAYING:
+                # a second start would spawn another game_loop for the same room
+                self.broadcast(room_id, {"action": "start_failed", "payload": {"reason": "Game already running"}})
+                return
+            if len(room.players) < 2:
                 self.broadcast(room_id, {"action": "start_failed", "payload": {"reason": "Need at least 2 players"}})
                 return
-            room["state"] = "playing"
-            room["current_round"] = 0
-            # reset scores
-            for p in room["players"].values():
-                p["score"] = 5000
+            self.prepare_game(room)
             # start game loop in background
-            t = threading.Thread(target=self.game_loop, args=(room_id,), daemon=True)
+            t = threading.Thread(target=self.game_loop, args=(room_id,), name="game_loop", daemon=True)
             t.start()
 
+    def prepare_game(self, room):
+        room.state = PLAYING
+        room.current_round = 0
+        # reset scores
+        for p in room.players.values():
+            p.score = START_SCORE
+        if room.log: room.log.start()
+
     def game_loop(self, room_id):
         # runs until winner found or room removed
         while True:
             with self.lock:
                 room = self.rooms.get(room_id)
-                if not room or room["state"] != "playing":
+                if not room or room.state != PLAYING:
                     break
-                room["current_round"] += 1
-                multiplier = 1.0 + (room["current_round"] - 1) * 0.25
-                coords = random.choice(SAMPLE_LOCATIONS)
-                room["coords"] = coords
-                room["guesses"] = {}
-                # reset guessed flags
-                for p in room["players"].values():
-                    p["guessed"] = False
+                rnd, multiplier, coords = self.begin_round(room)
 
             # send round start with coords (clients will fetch Street View)
             self.broadcast(room_id, {"action": "new_round", "payload": {
-                "round": room["current_round"],
+                "round": rnd,
                 "multiplier": multiplier,
                 "coords": coords
             }})
@@ -143,7 +181,7 @@ class GameManager:
                     room = self.rooms.get(room_id)
                     if not room:
                         return
-                    if len(room["guesses"]) >= len(room["players"]):
+                    if len(room.guesses) >= len(room.players):
                         break
                 time.sleep(0.5)
 
@@ -155,51 +193,72 @@ class GameManager:
                 self.evaluate_round(room_id)
 
                 # check for end condition: if a player's score <= 0 -> other wins
-                alive = [p for p in room["players"].values() if p["score"] > 0]
+                alive = [p for p in room.players.values() if p.score > 0]
                 if len(alive) < 2:
                     winner = None
                     if len(alive) == 1:
-                        winner = alive[0]["username"]
+                        winner = alive[0].username
+                    if room.log: room.log.end(alive[0].pid if winner else None)
                     self.broadcast(room_id, {"action": "game_over", "payload": {"winner": winner}})
-                    room["state"] = "finished"
+                    room.state = FINISHED
                     return
 
             # small pause before next round
             time.sleep(2)
 
+    def begin_round(self, room):
+        # yeni tur: konum odanın kendi rng'sinden seçilir, replay aynı sırayı üretir
+        room.current_round += 1
+        idx = room.rng.randrange(len(SAMPLE_LOCATIONS))
+        coords = SAMPLE_LOCATIONS[idx]
+        room.coords = coords
+        room.guesses.clear()
+        # reset guessed flags
+        for p in room.players.values():
+            p.guessed = False
+        if room.log: room.log.new_round(room.current_round, idx)
+        return room.current_round, room.multiplier(), coords
+
     def submit_guess(self, room_id, conn, lat, lon):
         with self.lock:
             room = self.rooms.get(room_id)
             if not room: return
+            player = room.player_for(conn)
+            if player is None:
+                # odada olmayan bağlantının tahmini turu kilitlemesin
+                return
             # record guess
-            room["guesses"][conn] = {"lat": lat, "lon": lon, "time": time.time()}
+            room.guesses[player.pid] = Guess(lat, lon, time.time())
+            if room.log: room.log.guess(player.pid, lat, lon)
             # mark guessed
-            if conn in room["players"]:
-                room["players"][conn]["guessed"] = True
+            player.guessed = True
             # notify others someone guessed
-            username = room["players"][conn]["username"] if conn in room["players"] else "Unknown"
+            username = player.username
             self.broadcast(room_id, {"action": "player_guessed", "payload": {"username": username}})
 
     def evaluate_round(self, room_id):
         room = self.rooms.get(room_id)
         if not room: return
-        coords = room.get("coords")
-        multiplier = 1.0 + (room["current_round"] - 1) * 0.25
+        coords = room.coords
+        multiplier = room.multiplier()
+        guesses = room.guesses
+        clat, clon = coords["lat"], coords["lon"]
         results = []
-        for conn, p in list(room["players"].items()):
-            guess = room["guesses"].get(conn)
-            if not guess:
+        for pid, p in room.players.items():
+            guess = guesses.get(pid)
+            if guess is None:
                 # if no guess, treat as max distance penalty (e.g. 20000 km)
                 dist = 20000.0
             else:
-                dist = haversine(coords["lat"], coords["lon"], guess["lat"], guess["lon"])
+                dist = haversine(clat, clon, guess.lat, guess.lon)
             damage = int(dist * 10 * multiplier)
-            p["score"] -= damage
+            p.score -= damage
+            if room.log: room.log.result(pid, damage, p.score)
             results.append({
-                "username": p["username"],
+                "username": p.username,
                 "dist_km": round(dist, 2),
                 "damage": damage,
-                "new_score": p["score"]
+                "new_score": p.score
             })
         # broadcast round results
         self.broadcast(room_id, {"action": "round_result", "payload": {"results": results, "coords": coords}})
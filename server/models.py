@@ -0,0 +1,84 @@
+# server/models.py
+# Oda / oyuncu durumu için hafif, __slots__'lu sınıflar.
+# Oyuncular bağlantı objesi yerine küçük int id'lerle tutulur; conn -> id eşlemesi oda içinde.
+
+import random
+
+WAITING = "waiting"
+PLAYING = "playing"
+FINISHED = "finished"
+
+START_SCORE = 5000
+
+
+class Player:
+    __slots__ = ("pid", "conn", "username", "score", "guessed")
+
+    def __init__(self, pid, conn, username):
+        self.pid = pid
+        self.conn = conn
+        self.username = username
+        self.score = START_SCORE
+        self.guessed = False
+
+
+class Guess:
+    __slots__ = ("lat", "lon", "time")
+
+    def __init__(self, lat, lon, time):
+        self.lat = lat
+        self.lon = lon
+        self.time = time
+
+
+class Room:
+    __slots__ = ("room_id", "players", "conn_ids", "guesses", "state",
+                 "current_round", "coords", "next_pid", "rng", "log")
+
+    def __init__(self, room_id, rng=None, log=None):
+        self.room_id = room_id
+        self.players = {}    # pid -> Player
+        self.conn_ids = {}   # conn -> pid
+        self.guesses = {}    # pid -> Guess
+        self.state = WAITING
+        self.current_round = 0
+        self.coords = None
+        self.next_pid = 0
+        self.rng = rng or random.Random()  # oda başına seed'li random.Random (replay için)
+        self.log = log  # replay_log.RoomLog veya None
+
+    def add_player(self, conn, username):
+        # aynı bağlantı tekrar katılırsa mevcut oyuncuyu güncelle
+        pid = self.conn_ids.get(conn)
+        if pid is not None:
+            player = self.players[pid]
+            player.username = username
+            return player
+        pid = self.next_pid
+        self.next_pid += 1
+        player = Player(pid, conn, username)
+        self.players[pid] = player
+        self.conn_ids[conn] = pid
+        return player
+
+    def remove_player(self, conn):
+        pid = self.conn_ids.pop(conn, None)
+        if pid is None:
+            return None
+        self.guesses.pop(pid, None)
+        return self.players.pop(pid, None)
+
+    def player_for(self, conn):
+        pid = self.conn_ids.get(conn)
+        if pid is None:
+            return None
+        return self.players.get(pid)
+
+    def conns(self):
+        return list(self.conn_ids)
+
+    def multiplier(self):
+        return 1.0 + (self.current_round - 1) * 0.25
+
+    def player_list(self):
+        return [{"username": p.username, "score": p.score} for p in self.players.values()]
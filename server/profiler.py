@@ -0,0 +1,93 @@
+# server/profiler.py
+# Çalışan sunucu için açılıp kapatılabilen istatistiksel örnekleyici.
+# Belirli aralıklarla tüm thread'lerin stack'ini (sys._current_frames) okur, her örneği
+# o thread'in o anki action etiketiyle birlikte sayar ve durdurulunca "collapsed stacks"
+# formatında diske yazar (flamegraph.pl / speedscope doğrudan okuyabilir).
+
+import collections
+import os
+import sys
+import threading
+import time
+
+INTERVAL = 0.005  # seconds between samples
+MAX_DEPTH = 64
+
+
+class SamplingProfiler:
+    def __init__(self, out_dir="profiles", interval=INTERVAL):
+        self.out_dir = out_dir
+        self.interval = interval
+        self.tags = {}  # thread ident -> action name
+        self.counts = collections.Counter()
+        self.samples = 0
+        self.started_at = None
+        self.running = False
+        self.thread = None
+        self.lock = threading.Lock()
+
+    # handle_client her mesajda çağırır; profiler kapalıyken de sadece bir dict ataması
+    def tag(self, name):
+        self.tags[threading.get_ident()] = name
+
+    def untag(self):
+        self.tags.pop(threading.get_ident(), None)
+
+    def start(self):
+        with self.lock:
+            if self.running:
+                return False
+            self.counts = collections.Counter()
+            self.samples = 0
+            self.started_at = time.time()
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+            self.thread.start()
+            return True
+
+    def stop(self):
+        """Örneklemeyi durdurur ve yazılan dosyanın yolunu döndürür."""
+        with self.lock:
+            if not self.running:
+                return None
+            self.running = False
+            thread = self.thread
+        thread.join()
+        return self.dump()
+
+    def toggle(self):
+        if self.running:
+            return False, self.stop()
+        self.start()
+        return True, None
+
+    def _run(self):
+        me = threading.get_ident()
+        names = {}
+        while self.running:
+            frames = sys._current_frames()
+            if len(names) != len(frames):
+                names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == me:
+                    continue
+                stack = []
+                f = frame
+                while f is not None and len(stack) < MAX_DEPTH:
+                    code = f.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    f = f.f_back
+                stack.reverse()
+                tag = self.tags.get(ident) or names.get(ident, "thread")
+                self.counts[f"{tag};" + ";".join(stack)] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def dump(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        path = os.path.join(self.out_dir, f"profile-{stamp}.collapsed")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
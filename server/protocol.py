@@ -0,0 +1,63 @@
+# server/protocol.py
+# İstemci mesajları için şema tablosu. Server.handle_client, GameManager'a hiçbir şey
+# iletmeden önce payload'u buradan doğrular; her kontrol sabit maliyetli.
+
+import math
+
+MAX_NAME = 32
+MAX_ROOM_ID = 32
+MAX_TOKEN = 128
+
+
+def text(max_len):
+    def check(v):
+        return isinstance(v, str) and 0 < len(v) <= max_len
+    return check
+
+
+def optional(check):
+    # mevcut istemci create_room/start_game'de room_id göndermiyor
+    def opt(v):
+        return v is None or check(v)
+    return opt
+
+
+def coord(limit):
+    def check(v):
+        return (isinstance(v, (int, float)) and not isinstance(v, bool)
+                and math.isfinite(v) and -limit <= v <= limit)
+    return check
+
+
+ROOM_ID = text(MAX_ROOM_ID)
+USERNAME = text(MAX_NAME)
+
+# action -> ({field: check}, token cost)
+SCHEMAS = {
+    "create_room": ({"room_id": optional(ROOM_ID), "username": USERNAME}, 5.0),
+    "join_room": ({"room_id": ROOM_ID, "username": USERNAME}, 2.0),
+    "leave_room": ({"room_id": optional(ROOM_ID)}, 1.0),
+    "start_game": ({"room_id": optional(ROOM_ID)}, 2.0),
+    "submit_guess": ({"room_id": optional(ROOM_ID), "lat": coord(90), "lon": coord(180)}, 1.0),
+    "spectate_room": ({"room_id": ROOM_ID}, 2.0),
+    "stop_spectating": ({}, 1.0),
+    "admin_profile": ({"token": text(MAX_TOKEN)}, 5.0),
+}
+
+
+def validate(action, payload):
+    """Geçerliyse None, değilse hata nedenini döndürür."""
+    spec = SCHEMAS.get(action)
+    if spec is None:
+        return "Unknown action"
+    if not isinstance(payload, dict):
+        return "Payload must be an object"
+    for field, check in spec[0].items():
+        if not check(payload.get(field)):
+            return f"Invalid {field}"
+    return None
+
+
+def cost(action):
+    spec = SCHEMAS.get(action)
+    return spec[1] if spec else 1.0
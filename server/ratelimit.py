@@ -0,0 +1,28 @@
+# server/ratelimit.py
+# Bağlantı başına token bucket. Sadece o bağlantının thread'i kullanır -> kilit yok, O(1).
+
+import time
+
+RATE = 10.0   # tokens per second
+BURST = 20.0  # bucket size
+
+
+class TokenBucket:
+    __slots__ = ("rate", "burst", "tokens", "last", "limited")
+
+    def __init__(self, rate=RATE, burst=BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.limited = False  # son mesaj reddedildi mi (bildirimi bir kez göndermek için)
+
+    def allow(self, cost=1.0):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            self.limited = False
+            return True
+        return False
@@ -0,0 +1,162 @@
+# server/replay.py
+# Replay log'larını GameManager mantığıyla (seed'li rng) soketsiz ve beklemesiz yeniden çalıştırır.
+# Hem skor anlaşmazlıklarını / regresyonları kontrol etmek hem de evaluate_round çekirdeğini
+# benchmark etmek için kullanılır.
+#
+#   python replay.py logs/*.glog                 # doğrula
+#   python replay.py logs/*.glog --repeat 200    # throughput ölç
+#   python replay.py --generate logs --players 8 # sentetik kayıt üret
+
+import argparse
+import random
+import sys
+import time
+
+from game_manager import GameManager, SAMPLE_LOCATIONS
+from models import Room
+from replay_log import ReplayWriter, read_log, JOIN, LEAVE, START, NEW_ROUND, GUESS, RESULT, END
+
+
+class NullConn:
+    """Gönderilen her şeyi yutan sahte bağlantı."""
+    __slots__ = ()
+
+    def send(self, data):
+        return len(data)
+
+
+class ReplayResult:
+    __slots__ = ("path", "rounds", "guesses", "errors")
+
+    def __init__(self, path):
+        self.path = path
+        self.rounds = 0
+        self.guesses = 0
+        self.errors = []
+
+
+def replay(path, events=None, header=None):
+    """Bir log'u baştan oynatır; kaydedilen sonuçlarla uyuşmayanları result.errors'a yazar."""
+    if events is None:
+        header, events = read_log(path)
+    result = ReplayResult(path)
+    game = GameManager()
+    key = header["room_id"]
+    room = Room(key, rng=random.Random(header["seed"]))
+    game.rooms[key] = room
+    conns = {}      # pid -> NullConn
+    before = None   # tur değerlendirilmeden önceki skorlar
+
+    for rtype, f in events:
+        if rtype == GUESS:
+            pid, lat, lon = f
+            game.submit_guess(key, conns.get(pid), lat, lon)
+            result.guesses += 1
+        elif rtype == RESULT:
+            pid, damage, new_score = f
+            if before is None:
+                before = {p.pid: p.score for p in room.players.values()}
+                game.evaluate_round(key)
+                result.rounds += 1
+            p = room.players.get(pid)
+            if p is None:
+                result.errors.append(f"round {room.current_round}: unknown pid {pid}")
+            elif p.score != new_score or before[pid] - p.score != damage:
+                result.errors.append(
+                    f"round {room.current_round}: pid {pid} got damage {before[pid] - p.score}"
+                    f" score {p.score}, log says damage {damage} score {new_score}")
+        elif rtype == NEW_ROUND:
+            rnd, idx = f
+            game.begin_round(room)
+            before = None
+            if room.current_round != rnd or room.coords is not SAMPLE_LOCATIONS[idx]:
+                result.errors.append(
+                    f"round {rnd}: replay picked round {room.current_round}"
+                    f" location {SAMPLE_LOCATIONS.index(room.coords)}, log says {idx}")
+        elif rtype == JOIN:
+            pid, username = f
+            conn = conns.setdefault(pid, NullConn())
+            player = room.add_player(conn, username)
+            if player.pid != pid:
+                result.errors.append(f"join {username}: replay pid {player.pid}, log says {pid}")
+        elif rtype == LEAVE:
+            room.remove_player(conns.pop(f[0], None))
+        elif rtype == START:
+            game.prepare_game(room)
+        elif rtype == END:
+            alive = [p for p in room.players.values() if p.score > 0]
+            winner = alive[0].pid if len(alive) == 1 else -1
+            if len(alive) >= 2 or winner != f[0]:
+                result.errors.append(f"game over: replay winner {winner}, log says {f[0]}")
+    return result
+
+
+def generate(log_dir, players=4, seed=None):
+    """Rastgele tahminlerle tam bir oyunu oynatıp log'a yazar (benchmark girdisi için)."""
+    rng = random.Random(seed)
+    writer = ReplayWriter(log_dir)
+    game = GameManager(seed=seed)
+    game.replay = writer
+    room_id = f"synthetic{players}"
+    conns = [NullConn() for _ in range(players)]
+    game.create_room(room_id, "player0", conns[0])
+    for i, conn in enumerate(conns[1:], 1):
+        game.join_room(room_id, f"player{i}", conn)
+    room = game.rooms[room_id]
+    game.prepare_game(room)
+    while True:
+        _, _, coords = game.begin_round(room)
+        for conn in conns:
+            # çoğu oyuncu hedefe yakın tahmin etsin, oyun birkaç tur sürsün
+            lat = coords["lat"] + rng.gauss(0, 2)
+            lon = coords["lon"] + rng.gauss(0, 2)
+            game.submit_guess(room_id, conn, lat, lon)
+        game.evaluate_round(room_id)
+        alive = [p for p in room.players.values() if p.score > 0]
+        if len(alive) < 2:
+            room.log.end(alive[0].pid if alive else None)
+            break
+    path = room.log.path
+    room.log.close()
+    writer.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay Guessr room logs")
+    parser.add_argument("logs", nargs="*")
+    parser.add_argument("--repeat", type=int, default=1, help="replay each log N times (benchmark)")
+    parser.add_argument("--generate", metavar="DIR", help="write a synthetic game log into DIR")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        print(generate(args.generate, args.players, args.seed))
+        return 0
+
+    failed = False
+    rounds = guesses = 0
+    elapsed = 0.0
+    for path in args.logs:
+        header, events = read_log(path)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            res = replay(path, events, header)
+        elapsed += time.perf_counter() - start
+        rounds += res.rounds * args.repeat
+        guesses += res.guesses * args.repeat
+        status = "OK" if not res.errors else f"{len(res.errors)} mismatches"
+        print(f"[REPLAY] {path}: {res.rounds} rounds, {res.guesses} guesses — {status}")
+        for err in res.errors:
+            print("   ", err)
+        failed = failed or bool(res.errors)
+
+    if elapsed > 0:
+        print(f"[REPLAY] {rounds} rounds / {guesses} guesses in {elapsed:.3f}s"
+              f" ({rounds / elapsed:.0f} rounds/s, {guesses / elapsed:.0f} guesses/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# server/replay_log.py
+# Oda başına append-only, kompakt binary olay kaydı.
+# Yazma işi tek bir arka plan thread'inde yapılır; oyun kilidi altında sadece kuyruğa bytes atılır.
+#
+# Dosya: MAGIC | header | kayıtlar...
+#   header : <BQ version, seed + <H len(room_id) + room_id (utf-8)
+#   kayıt  : <B tip + tipe göre sabit gövde (aşağıdaki _REC tablosu)
+
+import os
+import queue
+import re
+import struct
+import threading
+import time
+
+MAGIC = b"GLOG"
+VERSION = 1
+
+JOIN = 1        # pid, username
+LEAVE = 2       # pid
+START = 3       # -
+NEW_ROUND = 4   # round, location index
+GUESS = 5       # pid, lat, lon
+RESULT = 6      # pid, damage, new_score
+END = 7         # winner pid (-1 = yok)
+
+_HEADER = struct.Struct("<BQ")
+_TYPE = struct.Struct("<B")
+_STR_LEN = struct.Struct("<H")
+_REC = {
+    JOIN: struct.Struct("<I"),       # + <H len + username bytes
+    LEAVE: struct.Struct("<I"),
+    START: struct.Struct("<"),
+    NEW_ROUND: struct.Struct("<HB"),
+    GUESS: struct.Struct("<Idd"),
+    RESULT: struct.Struct("<Iqq"),
+    END: struct.Struct("<i"),
+}
+
+
+def _pack(rtype, *fields):
+    return _TYPE.pack(rtype) + _REC[rtype].pack(*fields)
+
+
+def _pack_str(s):
+    b = s.encode("utf-8")[:0xFFFF]
+    return _STR_LEN.pack(len(b)) + b
+
+
+class RoomLog:
+    """Tek bir odanın kaydı; tüm yazmalar ReplayWriter thread'ine devredilir."""
+
+    def __init__(self, writer, path, room_id, seed):
+        self.writer = writer
+        self.path = path
+        self.file = None  # writer thread'inde açılır
+        self._put(MAGIC + _HEADER.pack(VERSION, seed) + _pack_str(str(room_id)))
+
+    def _put(self, data):
+        self.writer.queue.put((self, data))
+
+    def _record(self, rtype, *fields):
+        try:
+            self._put(_pack(rtype, *fields))
+        except (struct.error, TypeError, ValueError):
+            # kayıt hatası oyunu durdurmasın
+            pass
+
+    def join(self, pid, username):
+        try:
+            self._put(_pack(JOIN, pid) + _pack_str(str(username)))
+        except (struct.error, TypeError, ValueError):
+            pass
+
+    def leave(self, pid):
+        self._record(LEAVE, pid)
+
+    def start(self):
+        self._record(START)
+
+    def new_round(self, rnd, loc_index):
+        self._record(NEW_ROUND, rnd, loc_index)
+
+    def guess(self, pid, lat, lon):
+        self._record(GUESS, pid, lat, lon)
+
+    def result(self, pid, damage, new_score):
+        self._record(RESULT, pid, damage, new_score)
+
+    def end(self, winner_pid):
+        self._record(END, -1 if winner_pid is None else winner_pid)
+
+    def close(self):
+        self.writer.queue.put((self, None))
+
+
+class ReplayWriter:
+    """Tüm odaların kayıtlarını diske yazan buffered arka plan yazıcı."""
+
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        os.makedirs(log_dir, exist_ok=True)
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def open_room(self, room_id, seed):
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", str(room_id))[:64]
+        name = f"{safe}-{int(time.time() * 1000)}-{seed & 0xFFFF:04x}.glog"
+        return RoomLog(self, os.path.join(self.log_dir, name), room_id, seed)
+
+    def _run(self):
+        dirty = set()
+        while True:
+            try:
+                # kuyruk boşalınca tamponları diske it
+                item = self.queue.get(timeout=1.0 if dirty else None)
+            except queue.Empty:
+                for log in dirty:
+                    self._flush(log)
+                dirty.clear()
+                continue
+            if item is None:
+                break
+            log, data = item
+            if data is None:
+                dirty.discard(log)
+                if log.file:
+                    log.file.close()
+                    log.file = None
+                continue
+            try:
+                if log.file is None:
+                    log.file = open(log.path, "ab", buffering=64 * 1024)
+                log.file.write(data)
+                dirty.add(log)
+            except OSError as e:
+                print("[REPLAY] write error:", e)
+            if self.queue.empty():
+                for log in dirty:
+                    self._flush(log)
+                dirty.clear()
+        for log in dirty:
+            self._flush(log)
+
+    def _flush(self, log):
+        try:
+            if log.file:
+                log.file.flush()
+        except OSError:
+            pass
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+
+def read_log(path):
+    """(header, events) döndürür; events: [(tip, alanlar tuple'ı), ...]"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path}: not a replay log")
+    pos = 4
+    version, seed = _HEADER.unpack_from(data, pos)
+    pos += _HEADER.size
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported log version {version}")
+    (n,) = _STR_LEN.unpack_from(data, pos)
+    pos += 2
+    room_id = data[pos:pos + n].decode("utf-8")
+    pos += n
+    header = {"version": version, "seed": seed, "room_id": room_id}
+
+    events = []
+    end = len(data)
+    while pos < end:
+        (rtype,) = _TYPE.unpack_from(data, pos)
+        pos += 1
+        rec = _REC.get(rtype)
+        if rec is None:
+            raise ValueError(f"{path}: bad record type {rtype} at {pos - 1}")
+        if pos + rec.size > end:
+            break  # yarım kalmış son kayıt
+        fields = rec.unpack_from(data, pos)
+        pos += rec.size
+        if rtype == JOIN:
+            if pos + _STR_LEN.size > end:
+                break
+            (n,) = _STR_LEN.unpack_from(data, pos)
+            pos += _STR_LEN.size
+            if pos + n > end:
+                break  # isim yarıda kesilmiş
+            fields = fields + (data[pos:pos + n].decode("utf-8"),)
+            pos += n
+        events.append((rtype, fields))
+    return header, events
@@ -2,35 +2,65 @@
 import socket
 import threading
 import json
+import hmac
+import os
+import signal
 from game_manager import GameManager
+from profiler import SamplingProfiler
+from ratelimit import TokenBucket
+import protocol
 
 HOST = "0.0.0.0"
 PORT = 5555
 BUFFER = 65536  # bytes
+# set to a directory to record per-room replay logs (see replay.py)
+REPLAY_DIR = os.environ.get("GUESSR_REPLAY_DIR")
+# profiling: GUESSR_PROFILE=1 starts sampling at boot; SIGUSR1 or admin_profile toggles it
+PROFILE_DIR = os.environ.get("GUESSR_PROFILE_DIR", "profiles")
+PROFILE_AT_START = os.environ.get("GUESSR_PROFILE") == "1"
+# admin actions are disabled unless a token is configured
+ADMIN_TOKEN = os.environ.get("GUESSR_ADMIN_TOKEN")
 
 class Server:
-    def __init__(self, host=HOST, port=PORT):
+    def __init__(self, host=HOST, port=PORT, replay_dir=REPLAY_DIR):
         self.host = host
         self.port = port
-        self.game = GameManager()
+        self.game = GameManager(replay_dir=replay_dir)
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server.bind((self.host, self.port))
         self.server.listen(50)
         print(f"[SERVER] Listening on {self.host}:{self.port}")
-        self.clients = {}  # conn -> (addr, username, current_room)
+        self.clients = {}  # conn -> (addr, username, current_room, spectating)
+        self.profiler = SamplingProfiler(PROFILE_DIR)
+        # action -> handler: each action in protocol.SCHEMAS is served by on_<action>
+        self.handlers = {action: getattr(self, "on_" + action) for action in protocol.SCHEMAS}
+        if PROFILE_AT_START:
+            self.profiler.start()
+
+    def toggle_profiler(self):
+        running, path = self.profiler.toggle()
+        if running:
+            print("[PROFILE] sampling started")
+        else:
+            print(f"[PROFILE] sampling stopped, wrote {path}")
+        return running, path
 
     def start(self):
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.toggle_profiler())
         try:
             while True:
                 conn, addr = self.server.accept()
                 print(f"[CONNECT] {addr}")
-                t = threading.Thread(target=self.handle_client, args=(conn, addr), daemon=True)
+                t = threading.Thread(target=self.handle_client, args=(conn, addr), name="client", daemon=True)
                 t.start()
         except KeyboardInterrupt:
             print("Server shutting down.")
         finally:
             self.server.close()
+            if self.profiler.running:
+                self.toggle_profiler()
 
     def send(self, conn, obj):
         try:
@@ -38,9 +68,80 @@ class Server:
         except Exception:
             pass
 
+    # ----------------- action handlers (payload already validated) -----------------
+    def _enter_room(self, conn, client, room_id):
+        # only called once GameManager accepted the connection into room_id
+        previous = client["room"]
+        if previous is not None and previous != room_id:
+            self.game.leave_room(previous, conn)
+        client["room"] = room_id
+
+    def on_create_room(self, conn, client, payload):
+        room_id = payload.get("room_id")
+        username = payload["username"]
+        client["username"] = username
+        if self.game.create_room(room_id, username, conn):
+            self._enter_room(conn, client, room_id)
+
+    def on_join_room(self, conn, client, payload):
+        room_id = payload["room_id"]
+        username = payload["username"]
+        client["username"] = username
+        if self.game.join_room(room_id, username, conn):
+            self._enter_room(conn, client, room_id)
+
+    def on_leave_room(self, conn, client, payload):
+        room_id = payload.get("room_id")
+        if room_id != client["room"]:
+            # only the connection's own room can be left
+            self.send(conn, {"action": "invalid_request", "payload": {"action": "leave_room", "reason": "Not in room"}})
+            return
+        self.game.leave_room(room_id, conn)
+        client["room"] = None
+
+    def on_start_game(self, conn, client, payload):
+        room_id = payload.get("room_id")
+        if room_id != client["room"]:
+            # only players of a room can start it
+            self.send(conn, {"action": "invalid_request", "payload": {"action": "start_game", "reason": "Not in room"}})
+            return
+        self.game.start_game(room_id)
+
+    def on_submit_guess(self, conn, client, payload):
+        room_id = payload.get("room_id")
+        if room_id != client["room"]:
+            # guesses only count for the room this connection is in
+            self.send(conn, {"action": "invalid_request", "payload": {"action": "submit_guess", "reason": "Not in room"}})
+            return
+        self.game.submit_guess(room_id, conn, payload["lat"], payload["lon"])
+
+    def on_spectate_room(self, conn, client, payload):
+        room_id = payload["room_id"]
+        previous = client["spectating"]
+        if previous is not None:
+            self.game.stop_spectating(previous, conn)
+            client["spectating"] = None
+        if self.game.spectate(room_id, conn):
+            client["spectating"] = room_id
+
+    def on_stop_spectating(self, conn, client, payload):
+        self.game.stop_spectating(client["spectating"], conn)
+        client["spectating"] = None
+
+    def on_admin_profile(self, conn, client, payload):
+        if ADMIN_TOKEN and hmac.compare_digest(payload["token"].encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            running, path = self.toggle_profiler()
+            # don't expose server-side directories to the client
+            dump = os.path.basename(path) if path else None
+            self.send(conn, {"action": "admin_profile_ok", "payload": {"running": running, "file": dump}})
+        else:
+            self.send(conn, {"action": "admin_failed", "payload": {"reason": "Not allowed"}})
+
     def handle_client(self, conn, addr):
         # initial state
-        self.clients[conn] = {"addr": addr, "username": None, "room": None}
+        client = {"addr": addr, "username": None, "room": None, "spectating": None}
+        self.clients[conn] = client
+        bucket = TokenBucket()
         try:
             while True:
                 data = conn.recv(BUFFER)
@@ -51,53 +152,43 @@ class Server:
                 except Exception:
                     # ignore bad messages
                     continue
+                if not isinstance(msg, dict):
+                    continue
                 action = msg.get("action")
+                handler = self.handlers.get(action)
+                if handler is None:
+                    # unknown action, ignore
+                    continue
+                # rate limit + validation happen before any shared state is touched
+                if not bucket.allow(protocol.cost(action)):
+                    if not bucket.limited:
+                        bucket.limited = True
+                        self.send(conn, {"action": "rate_limited", "payload": {"action": action}})
+                    continue
                 payload = msg.get("payload", {})
+                reason = protocol.validate(action, payload)
+                if reason:
+                    self.send(conn, {"action": "invalid_request", "payload": {"action": action, "reason": reason}})
+                    continue
 
-                # handle actions
-                if action == "create_room":
-                    room_id = payload.get("room_id")
-                    username = payload.get("username")
-                    self.clients[conn]["username"] = username
-                    self.clients[conn]["room"] = room_id
-                    self.game.create_room(room_id, username, conn)
-
-                elif action == "join_room":
-                    room_id = payload.get("room_id")
-                    username = payload.get("username")
-                    self.clients[conn]["username"] = username
-                    self.clients[conn]["room"] = room_id
-                    self.game.join_room(room_id, username, conn)
-
-                elif action == "leave_room":
-                    room_id = payload.get("room_id")
-                    self.game.leave_room(room_id, conn)
-                    self.clients[conn]["room"] = None
-
-                elif action == "start_game":
-                    room_id = payload.get("room_id")
-                    self.game.start_game(room_id)
-
-                elif action == "submit_guess":
-                    room_id = payload.get("room_id")
-                    lat = payload.get("lat")
-                    lon = payload.get("lon")
-                    self.game.submit_guess(room_id, conn, lat, lon)
-
-                else:
-                    # unknown action, ignore
-                    pass
+                self.profiler.tag(action)
+                handler(conn, client, payload)
+                # idle time in recv() is attributed to the thread, not the last action
+                self.profiler.tag(None)
 
         except ConnectionResetError:
             pass
         finally:
             # cleanup
+            self.profiler.untag()
             client = self.clients.get(conn)
             if client and client["room"]:
                 try:
                     self.game.leave_room(client["room"], conn)
                 except Exception:
                     pass
+            if client and client["spectating"] is not None:
+                self.game.stop_spectating(client["spectating"], conn)
             if conn in self.clients:
                 del self.clients[conn]
             try:
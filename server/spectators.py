@@ -0,0 +1,122 @@
+# server/spectators.py
+# İzleyiciler (spectator) için oyun döngüsünden ayrı, salt okunur yayın katmanı.
+# Oyun tarafı publish() ile olayı sadece kuyruğa ekler; ayrı bir thread her tick'te
+# oda başına biriken olayları tek bir "spectate_batch" mesajında birleştirip bir kez encode eder
+# ve aynı bytes'ı tüm izleyicilere gönderir. İzleyiciler birkaç yüz ms geriden gelebilir.
+
+import json
+import select
+import socket
+import threading
+import time
+
+TICK = 0.25  # seconds
+# tek bir yavaş izleyici hub thread'ini kilitlemesin: gönderim asla bloklamaz
+SEND_FLAGS = getattr(socket, "MSG_DONTWAIT", 0)
+
+
+class SpectatorHub:
+    def __init__(self, tick=TICK):
+        self.tick = tick
+        self.lock = threading.Lock()  # oyun kilidinden bağımsız
+        # room_id -> {conn: offset}; offset = izleyici eklendiğinde pending'de zaten
+        # bekleyen olay sayısı (snapshot'tan önceki olayları tekrar almasın)
+        self.watchers = {}
+        self.pending = {}    # room_id -> [event, ...]
+        self.closing = set()
+        self.thread = None
+
+    def _ensure_thread(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def add(self, room_id, conn):
+        with self.lock:
+            self.watchers.setdefault(room_id, {})[conn] = len(self.pending.get(room_id, ()))
+            self.closing.discard(room_id)
+            self._ensure_thread()
+
+    def remove(self, room_id, conn):
+        with self.lock:
+            conns = self.watchers.get(room_id)
+            if not conns: return
+            conns.pop(conn, None)
+            if not conns:
+                del self.watchers[room_id]
+                self.pending.pop(room_id, None)
+
+    def count(self, room_id):
+        with self.lock:
+            return len(self.watchers.get(room_id, ()))
+
+    def publish(self, room_id, obj):
+        # izleyici yoksa hiçbir şey yapma; varsa sadece listeye ekle
+        if room_id not in self.watchers:
+            return
+        with self.lock:
+            if room_id in self.watchers:
+                self.pending.setdefault(room_id, []).append(obj)
+
+    def close_room(self, room_id):
+        # son bir "room_closed" gönderip odanın izleyicilerini bırak
+        with self.lock:
+            if room_id not in self.watchers: return
+            self.pending.setdefault(room_id, []).append({"action": "room_closed", "payload": {"room_id": room_id}})
+            self.closing.add(room_id)
+
+    def _run(self):
+        while True:
+            time.sleep(self.tick)
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self.pending:
+                return
+            pending, self.pending = self.pending, {}
+            targets = {room_id: list(self.watchers.get(room_id, {}).items()) for room_id in pending}
+            # sonraki tick'te herkes baştan başlar
+            for room_id in pending:
+                conns = self.watchers.get(room_id)
+                if conns:
+                    self.watchers[room_id] = dict.fromkeys(conns, 0)
+            for room_id in self.closing:
+                self.watchers.pop(room_id, None)
+            self.closing.clear()
+
+        dead = []
+        for room_id, events in pending.items():
+            frames = {}  # offset -> encoded batch; neredeyse herkes offset 0'da
+            for conn, offset in targets[room_id]:
+                if offset >= len(events):
+                    continue
+                data = frames.get(offset)
+                if data is None:
+                    data = json.dumps({"action": "spectate_batch",
+                                       "payload": {"room_id": room_id, "events": events[offset:]}}).encode('utf-8')
+                    frames[offset] = data
+                if not self._send(conn, data):
+                    dead.append((room_id, conn))
+        for room_id, conn in dead:
+            self.remove(room_id, conn)
+            self._drop(conn)
+
+    def _drop(self, conn):
+        # akışı bozulmuş / takılmış bağlantıyı kapat: handle_client recv'den EOF alır ve
+        # normal disconnect temizliğini (spectating, oda üyeliği) yapar
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _send(self, conn, data):
+        # tamponu dolu (okumayı bırakmış) izleyici düşürülür; yarım frame de akışı bozar
+        try:
+            if not SEND_FLAGS:
+                _, writable, _ = select.select([], [conn], [], 0)
+                if not writable:
+                    return False
+            return conn.send(data, SEND_FLAGS) == len(data)
+        except (BlockingIOError, socket.timeout, OSError):
+            return False
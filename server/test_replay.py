@@ -0,0 +1,48 @@
+# server/test_replay.py
+# Replay tabanlı regresyon kontrolü: üretilen bir oyun log'u kendi skorlarını tekrar üretmeli,
+# değiştirilmiş bir RESULT kaydı ise uyuşmazlık olarak yakalanmalı.
+#
+#   cd server && python -m unittest test_replay    (veya: python -m pytest)
+
+import os
+import tempfile
+import unittest
+
+import replay
+from replay_log import RESULT, _pack, read_log
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = replay.generate(self.tmp.name, players=4, seed=1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_generated_log_replays_cleanly(self):
+        result = replay.replay(self.path)
+        self.assertGreater(result.rounds, 0)
+        self.assertEqual(result.errors, [])
+
+    def test_same_seed_generates_same_log(self):
+        other = replay.generate(os.path.join(self.tmp.name, "again"), players=4, seed=1)
+        self.assertEqual(read_log(self.path)[1], read_log(other)[1])
+
+    def test_tampered_result_is_reported(self):
+        _, events = read_log(self.path)
+        pid, damage, new_score = next(f for rtype, f in events if rtype == RESULT)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        original = _pack(RESULT, pid, damage, new_score)
+        self.assertIn(original, data)
+        with open(self.path, "wb") as f:
+            f.write(data.replace(original, _pack(RESULT, pid, damage + 1, new_score - 1), 1))
+
+        result = replay.replay(self.path)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn(f"pid {pid}", result.errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()